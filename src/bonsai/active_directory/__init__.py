@@ -5,6 +5,15 @@ from typing import Dict, Optional, Union
 from .sid import SID
 from .acl import ACL, ACLRevision, ACE, ACEFlag, ACERight, ACEType
 
+# Precompiled struct for the fixed-size security descriptor header.
+_SD_HEADER = struct.Struct("<BBHIIII")
+
+
+def _acl_at(data: bytes, offset: int) -> ACL:
+    """Create an ACL from its bounded byte range inside the blob."""
+    acl_size = data[offset + 2] | (data[offset + 3] << 8)
+    return ACL.from_binary(data[offset : offset + acl_size])
+
 
 class SecurityDescriptor:
     """
@@ -104,16 +113,16 @@ class SecurityDescriptor:
                 offset_group,
                 offset_sacl,
                 offset_dacl,
-            ) = struct.unpack("<BBHIIII", data[:20])
+            ) = _SD_HEADER.unpack_from(data)
             ctrl = cls.__convert_ctrl(ctrl)
-            owner_sid = SID(bytes_le=data[offset_owner:]) if offset_owner else None
-            group_sid = SID(bytes_le=data[offset_group:]) if offset_group else None
+            owner_sid = SID._from_buffer(data, offset_owner) if offset_owner else None
+            group_sid = SID._from_buffer(data, offset_group) if offset_group else None
             if ctrl["sacl_present"] and offset_sacl != 0:
-                sacl = ACL.from_binary(data[offset_sacl:])
+                sacl = _acl_at(data, offset_sacl)
             if ctrl["dacl_present"] and offset_dacl != 0:
-                dacl = ACL.from_binary(data[offset_dacl:])
+                dacl = _acl_at(data, offset_dacl)
             return cls(ctrl, owner_sid, group_sid, sacl, dacl, rev, sbz1)
-        except struct.error as err:
+        except (struct.error, IndexError) as err:
             raise ValueError(f"Not a valid binary SecurityDescriptor, {err}")
 
     def to_binary(self) -> bytes:
@@ -145,8 +154,7 @@ class SecurityDescriptor:
         if self.dacl:
             dacl = self.dacl.to_binary()
             offset_dacl = 20 + len(owner) + len(group) + len(sacl)
-        struct.pack_into(
-            "<BBHIIII",
+        _SD_HEADER.pack_into(
             data,
             0,
             self.revision,
@@ -2,10 +2,44 @@ import struct
 import uuid
 
 from enum import IntEnum
-from typing import List, Optional, Set, Union
+from typing import (
+    AbstractSet,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .sid import SID
 
+# Precompiled structs for the fixed-size binary headers, to avoid
+# re-parsing the format strings on every ACE/ACL. The unpack methods
+# are bound once so the hot parsing paths skip the attribute lookups.
+_ACE_HEADER = struct.Struct("<BBHL")
+_ACL_HEADER = struct.Struct("<BBHHH")
+_unpack_ace_header = _ACE_HEADER.unpack_from
+_unpack_acl_header = _ACL_HEADER.unpack_from
+
+
+def _uuid_from_bytes_le(data: bytes) -> uuid.UUID:
+    """
+    Create a UUID from 16 little-endian GUID bytes, skipping the keyword
+    dispatch and revalidation of the `uuid.UUID` constructor.
+    """
+    guid = uuid.UUID.__new__(uuid.UUID)
+    object.__setattr__(
+        guid,
+        "int",
+        int.from_bytes(data[3::-1] + data[5:3:-1] + data[7:5:-1] + data[8:], "big"),
+    )
+    object.__setattr__(guid, "is_safe", uuid.SafeUUID.unknown)
+    return guid
+
 
 class ACEFlag(IntEnum):
     """ACE type-specific control flags."""
@@ -33,6 +67,15 @@ class ACEFlag(IntEnum):
         return short_names[self.name]
 
 
+# Precomputed (bit, member) pairs and a lookup table for every possible
+# flag byte, so decoding flags during parsing is a single indexing
+# operation instead of iterating the enum members per ACE.
+_ACEFLAG_TABLE = tuple((flg.value, flg) for flg in ACEFlag)
+_ACEFLAG_LUT = tuple(
+    frozenset(flg for bit, flg in _ACEFLAG_TABLE if num & bit) for num in range(256)
+)
+
+
 class ACEType(IntEnum):
     """Type of the ACE."""
 
@@ -87,16 +130,7 @@ class ACEType(IntEnum):
     @property
     def is_object_type(self) -> bool:
         """Flag for ACE types with objects."""
-        return self in (
-            ACEType.ACCESS_ALLOWED_OBJECT,
-            ACEType.ACCESS_DENIED_OBJECT,
-            ACEType.SYSTEM_AUDIT_OBJECT,
-            ACEType.SYSTEM_ALARM_OBJECT,
-            ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT,
-            ACEType.ACCESS_DENIED_CALLBACK_OBJECT,
-            ACEType.SYSTEM_AUDIT_CALLBACK_OBJECT,
-            ACEType.SYSTEM_ALARM_CALLBACK_OBJECT,
-        )
+        return self.value in _OBJECT_ACE_TYPES
 
     @property
     def is_access_allowed(self) -> bool:
@@ -120,6 +154,23 @@ class ACEType(IntEnum):
         )
 
 
+# Raw values of the object-type ACE types, kept as a frozenset so the
+# per-ACE membership test during parsing is a hash lookup instead of a
+# linear scan over enum members.
+_OBJECT_ACE_TYPES = frozenset(
+    {
+        ACEType.ACCESS_ALLOWED_OBJECT.value,
+        ACEType.ACCESS_DENIED_OBJECT.value,
+        ACEType.SYSTEM_AUDIT_OBJECT.value,
+        ACEType.SYSTEM_ALARM_OBJECT.value,
+        ACEType.ACCESS_ALLOWED_CALLBACK_OBJECT.value,
+        ACEType.ACCESS_DENIED_CALLBACK_OBJECT.value,
+        ACEType.SYSTEM_AUDIT_CALLBACK_OBJECT.value,
+        ACEType.SYSTEM_ALARM_CALLBACK_OBJECT.value,
+    }
+)
+
+
 class ACERight(IntEnum):
     """The rights of the ACE."""
 
@@ -172,6 +223,56 @@ class ACERight(IntEnum):
         return short_names[self.name]
 
 
+# Precomputed (bit, member) pairs for decomposing an access mask without
+# iterating all ACERight members on every access, and the union of all
+# defined right bits for validating a mask with a single AND.
+_ACERIGHT_TABLE = tuple((rgt.value, rgt) for rgt in ACERight)
+_ACERIGHT_MASK = sum(rgt.value for rgt in ACERight)
+_ACERIGHT_VALUES = frozenset(rgt.value for rgt in ACERight)
+
+_S = TypeVar("_S")
+
+
+class _ACERightsView(AbstractSet):
+    """
+    A read-only, set-like view of the ACERight members in an access
+    mask. Membership tests are answered from the mask directly, without
+    materializing a set of enum members.
+    """
+
+    __slots__ = ("__mask", "__members")
+
+    def __init__(self, mask: int) -> None:
+        self.__mask = mask
+        self.__members = None  # type: Optional[FrozenSet[ACERight]]
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[_S]) -> AbstractSet[_S]:
+        return set(it)
+
+    def __materialize(self) -> "FrozenSet[ACERight]":
+        mask = self.__mask
+        members = frozenset(rgt for bit, rgt in _ACERIGHT_TABLE if mask & bit)
+        self.__members = members
+        return members
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, int):
+            return False
+        return item in _ACERIGHT_VALUES and bool(self.__mask & item)
+
+    def __iter__(self) -> Iterator[ACERight]:
+        members = self.__members
+        return iter(members if members is not None else self.__materialize())
+
+    def __len__(self) -> int:
+        members = self.__members
+        return len(members if members is not None else self.__materialize())
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
 class ACLRevision(IntEnum):
     """The ACL revision."""
 
@@ -179,6 +280,52 @@ class ACLRevision(IntEnum):
     ACL_REVISION_DS = 0x04
 
 
+_ACEBody = Tuple[Optional[uuid.UUID], Optional[uuid.UUID], SID, bytes]
+
+
+def _parse_plain_ace(mv: memoryview, pos: int, end: int) -> _ACEBody:
+    """Parse the body of an ACE without object-type fields."""
+    # The SID length follows from its subauthority count byte.
+    sid_end = pos + 16 + mv[pos + 9] * 4
+    trustee_sid = SID._from_buffer(mv, pos + 8)
+    return None, None, trustee_sid, bytes(mv[sid_end:end])
+
+
+def _parse_object_ace(mv: memoryview, pos: int, end: int) -> _ACEBody:
+    """Parse the body of an object-type ACE."""
+    obj_flag = int.from_bytes(mv[pos + 8 : pos + 12], "little")
+    if obj_flag == 0x00000003:
+        # The dominant layout in AD: both GUIDs present, so every field
+        # sits at a fixed offset and the parse is straight-line.
+        sid_pos = pos + 44
+        sid_end = sid_pos + 8 + mv[sid_pos + 1] * 4
+        return (
+            _uuid_from_bytes_le(bytes(mv[pos + 12 : pos + 28])),
+            _uuid_from_bytes_le(bytes(mv[pos + 28 : pos + 44])),
+            SID._from_buffer(mv, sid_pos),
+            bytes(mv[sid_end:end]),
+        )
+    object_type = None
+    inherited_object_type = None
+    pos += 12
+    if obj_flag & 0x00000001:
+        object_type = _uuid_from_bytes_le(bytes(mv[pos : pos + 16]))
+        pos += 16
+    if obj_flag & 0x00000002:
+        inherited_object_type = _uuid_from_bytes_le(bytes(mv[pos : pos + 16]))
+        pos += 16
+    sid_end = pos + 8 + mv[pos + 1] * 4
+    trustee_sid = SID._from_buffer(mv, pos)
+    return object_type, inherited_object_type, trustee_sid, bytes(mv[sid_end:end])
+
+
+# Body parser for each ACE type, indexed by the raw type byte.
+_ACE_BODY_PARSERS = tuple(
+    _parse_object_ace if num in _OBJECT_ACE_TYPES else _parse_plain_ace
+    for num in range(len(ACEType))
+)
+
+
 class ACE:
     """
     A class for the access control entry, that encodes the user rights
@@ -195,6 +342,17 @@ class ACE:
     :param bytes application_data: optional application data.
     """
 
+    __slots__ = (
+        "__type",
+        "__flags",
+        "__mask",
+        "__rights",
+        "__object_type",
+        "__inherited_object_type",
+        "__trustee_sid",
+        "__application_data",
+    )
+
     def __init__(
         self,
         ace_type: ACEType,
@@ -208,6 +366,7 @@ class ACE:
         self.__type = ace_type
         self.__flags = flags
         self.__mask = mask
+        self.__rights = None  # type: Optional[_ACERightsView]
         self.__object_type = object_type
         self.__inherited_object_type = inherited_object_type
         self.__trustee_sid = trustee_sid
@@ -225,29 +384,30 @@ class ACE:
         :raises ValueError: when the input cannot be parsed as an ACE
             object.
         """
+        if not isinstance(data, bytes):
+            raise TypeError("The `data` parameter must be bytes")
+        return cls._from_buffer(memoryview(data), 0)
+
+    @classmethod
+    def _from_buffer(cls, mv: memoryview, pos: int) -> "ACE":
+        """
+        Create an ACE object from a memoryview at the given offset,
+        copying only the bytes that end up owned by the new instance.
+        """
         try:
-            if not isinstance(data, bytes):
-                raise TypeError("The `data` parameter must be bytes")
-            object_type = None
-            inherited_object_type = None
-            application_data = None
-            ace_type, flags, size, mask = struct.unpack("<BBHL", data[:8])
-            pos = 8
-            if ACEType(ace_type).is_object_type:
-                obj_flag = struct.unpack("<I", data[8:12])[0]
-                pos += 4
-                if obj_flag & 0x00000001:
-                    object_type = uuid.UUID(bytes_le=data[pos : pos + 16])
-                    pos += 16
-                if obj_flag & 0x00000002:
-                    inherited_object_type = uuid.UUID(bytes_le=data[pos : pos + 16])
-                    pos += 16
-            trustee_sid = SID(bytes_le=data[pos:])
-            pos += trustee_sid.size
-            application_data = data[pos:size]
+            ace_type, flags, size, mask = _unpack_ace_header(mv, pos)
+            # Coerce (and validate) the type once, then dispatch to the
+            # straight-line parser for its body layout.
+            ace_type = ACEType(ace_type)
+            (
+                object_type,
+                inherited_object_type,
+                trustee_sid,
+                application_data,
+            ) = _ACE_BODY_PARSERS[ace_type](mv, pos, pos + size)
             this = cls(
-                ACEType(ace_type),
-                {flg for flg in ACEFlag if flags & flg},
+                ace_type,
+                _ACEFLAG_LUT[flags],
                 mask,
                 trustee_sid,
                 object_type,
@@ -255,7 +415,7 @@ class ACE:
                 application_data,
             )
             return this
-        except struct.error as err:
+        except (struct.error, IndexError) as err:
             raise ValueError(f"Not a valid binary ACE, {err}") from None
 
     def __eq__(self, other: object) -> bool:
@@ -300,25 +460,27 @@ class ACE:
         :returns: Bytes of the binary ACE instance
         :rtype: bytes
         """
+        ace_type = self.type
+        object_type = self.object_type
+        inherited_object_type = self.inherited_object_type
         size = self.size
         data = bytearray(size)
-        struct.pack_into(
-            "<BBHL", data, 0, self.type.value, sum(self.flags), size, self.mask
-        )
+        _ACE_HEADER.pack_into(data, 0, ace_type.value, sum(self.flags), size, self.mask)
         pos = 8
-        if self.type.is_object_type:
-            obj_flag = 0x00000001 if self.object_type else 0
-            obj_flag |= 0x00000002 if self.inherited_object_type else 0
+        if ace_type.is_object_type:
+            obj_flag = 0x00000001 if object_type else 0
+            obj_flag |= 0x00000002 if inherited_object_type else 0
             struct.pack_into("<L", data, pos, obj_flag)
             pos += 4
-            if self.object_type:
-                data[pos : pos + 16] = self.object_type.bytes_le
+            if object_type:
+                data[pos : pos + 16] = object_type.bytes_le
                 pos += 16
-            if self.inherited_object_type:
-                data[pos : pos + 16] = self.inherited_object_type.bytes_le
+            if inherited_object_type:
+                data[pos : pos + 16] = inherited_object_type.bytes_le
                 pos += 16
-        data[pos : pos + self.trustee_sid.size] = self.trustee_sid.bytes_le
-        pos += self.trustee_sid.size
+        sid_bytes = self.trustee_sid.bytes_le
+        data[pos : pos + len(sid_bytes)] = sid_bytes
+        pos += len(sid_bytes)
         data[pos : pos + size] = self.application_data
         return bytes(data)
 
@@ -334,13 +496,15 @@ class ACE:
         access mask.
         """
         if isinstance(rights, int):
-            if rights != sum({rgt for rgt in ACERight if rights & rgt}):
+            if rights & ~_ACERIGHT_MASK:
                 raise ValueError(
                     f"{rights} is not a valid access rights for an ACE object."
                 )
             self.__mask = rights
+            self.__rights = None
         elif all(isinstance(rgt, ACERight) for rgt in rights):
             self.__mask = sum(rights)
+            self.__rights = None
         else:
             raise TypeError(
                 "The rights parameter must be an int or a set of ACERight objects."
@@ -443,12 +607,12 @@ class ACE:
         size = 8
         if self.type.is_object_type:
             size += 4
-            if self.object_type:
+            if self.__object_type:
                 size += 16
-            if self.inherited_object_type:
+            if self.__inherited_object_type:
                 size += 16
-        size += self.trustee_sid.size
-        size += len(self.application_data)
+        size += self.__trustee_sid.size
+        size += len(self.__application_data)
         return size
 
     @property
@@ -461,9 +625,11 @@ class ACE:
         self.set_access_rights(value)
 
     @property
-    def rights(self) -> Set[ACERight]:
+    def rights(self) -> AbstractSet[ACERight]:
         """The set of ACERights based on the access mask."""
-        return {rgt for rgt in ACERight if self.mask & rgt}
+        if self.__rights is None:
+            self.__rights = _ACERightsView(self.__mask)
+        return self.__rights
 
     @rights.setter
     def rights(self, value: Set[ACERight]) -> None:
@@ -516,6 +682,8 @@ class ACL:
     :param List[ACE] aces: list of :class:`ACE`.
     """
 
+    __slots__ = ("__revision", "__aces")
+
     def __init__(self, revision: ACLRevision, aces: List[ACE]) -> None:
         self.__revision = revision
         self.__aces = aces
@@ -536,16 +704,19 @@ class ACL:
             if not isinstance(data, bytes):
                 raise TypeError("The `data` parameter must be bytes")
             # Unwanted values are the reserved sbz1, size and sbz2.
-            rev, _, _, count, _ = struct.unpack("<BBHHH", data[:8])
+            rev, _, _, count, _ = _unpack_acl_header(data)
+            mv = memoryview(data)
             pos = 8
             aces = []
             for _ in range(count):
-                ace = ACE.from_binary(data[pos:])
-                aces.append(ace)
-                pos += ace.size
+                # Read the ACE's declared size up front and parse it in
+                # place from the shared view, without slicing out a copy.
+                ace_size = data[pos + 2] | (data[pos + 3] << 8)
+                aces.append(ACE._from_buffer(mv, pos))
+                pos += ace_size
             this = cls(ACLRevision(rev), aces)
             return this
-        except struct.error as err:
+        except (struct.error, IndexError) as err:
             raise ValueError(f"Not a valid binary ACL, {err}") from None
 
     def to_binary(self) -> bytes:
@@ -557,7 +728,7 @@ class ACL:
         """
         size = self.size
         data = bytearray(8)
-        struct.pack_into("<BBHHH", data, 0, self.revision, 0, size, len(self.aces), 0)
+        _ACL_HEADER.pack_into(data, 0, self.revision, 0, size, len(self.aces), 0)
         for ace in self.aces:
             data.extend(ace.to_binary())
         return bytes(data)
@@ -2,6 +2,9 @@ import struct
 
 from typing import Any, Optional, Tuple
 
+# Precompiled struct for the fixed-size part of a binary SID.
+_SID_HEADER = struct.Struct("<BB6B")
+
 
 class SID:
     """
@@ -42,11 +45,13 @@ class SID:
             try:
                 if not isinstance(bytes_le, bytes):
                     raise TypeError("The `bytes_le` parameter must be bytes")
-                self.__revision, subauth_count, *identifier_auth = struct.unpack(
-                    "<BB6B", bytes_le[:8]
-                )
-                self.__subauthorities = struct.unpack(
-                    f"<{subauth_count}I", bytes_le[8 : 8 + (subauth_count * 4)]
+                (
+                    self.__revision,
+                    subauth_count,
+                    *identifier_auth,
+                ) = _SID_HEADER.unpack_from(bytes_le)
+                self.__subauthorities = struct.unpack_from(
+                    f"<{subauth_count}I", bytes_le, 8
                 )
                 self.__identifier_authority = sum(
                     num << ((5 - i) * 8) for i, num in enumerate(identifier_auth)
@@ -54,6 +59,32 @@ class SID:
             except struct.error as err:
                 raise ValueError(f"Not a valid binary SID, {err}")
 
+    @classmethod
+    def _from_buffer(cls, buf: Any, offset: int = 0) -> "SID":
+        """
+        Create a SID object from a buffer (e.g. bytes or memoryview) at
+        the given offset, without slicing a copy of the SID's bytes.
+
+        :param buf: a little-endian byte ordered buffer.
+        :param int offset: the position of the SID in the buffer.
+        :returns: A new SID instance.
+        :rtype: SID
+        :raises ValueError: when the buffer cannot be parsed as a valid
+            SID.
+        """
+        try:
+            rev, subauth_count, *identifier_auth = _SID_HEADER.unpack_from(buf, offset)
+            subauths = struct.unpack_from(f"<{subauth_count}I", buf, offset + 8)
+        except struct.error as err:
+            raise ValueError(f"Not a valid binary SID, {err}")
+        this = cls.__new__(cls)
+        this.__revision = rev
+        this.__subauthorities = subauths
+        this.__identifier_authority = sum(
+            num << ((5 - i) * 8) for i, num in enumerate(identifier_auth)
+        )
+        return this
+
     def __str__(self) -> str:
         """Return the string format of the SID."""
         ident_auth = (
@@ -1,11 +1,30 @@
-from typing import Any, List, Union, Iterable, Optional
+from typing import Any, Dict, List, Union, Iterable, Optional
 
 try:
     from typing import SupportsIndex
 except ImportError:
     from typing_extensions import SupportsIndex
 
-import bonsai
+
+def _lower_key(value: Any) -> bytes:
+    """
+    Convert a value to the lower-cased byte representation that is used
+    for the uniqueness comparison, the same way as the module's C part
+    does: None becomes empty, bools are TRUE/FALSE (see RFC 4517
+    3.3.3), strings and everything else are compared by their UTF-8
+    encoded forms.
+    """
+    if value is None:
+        raw = b""
+    elif isinstance(value, bytes):
+        raw = value
+    elif isinstance(value, bool):
+        raw = b"TRUE" if value else b"FALSE"
+    elif isinstance(value, str):
+        raw = value.encode("UTF-8")
+    else:
+        raw = str(value).encode("UTF-8")
+    return raw.lower()
 
 
 class LDAPValueList(list):
@@ -21,13 +40,16 @@ class LDAPValueList(list):
     :raises ValueError: if `items` has a non-unique element.
     """
 
-    __slots__ = ("__deleted", "__added", "__status")
+    __slots__ = ("__deleted", "__added", "__status", "__keymap")
 
     def __init__(self, items: Optional[Iterable[Any]] = None) -> None:
         super().__init__()
         self.__added = []  # type: List[str]
         self.__deleted = []  # type: List[str]
         self.__status = 0
+        # Index of the lower-cased keys of the list elements, so the
+        # uniqueness checks don't have to scan the whole list.
+        self.__keymap = {}  # type: Dict[bytes, Any]
         if items:
             for item in items:
                 self.append(item)
@@ -43,14 +65,32 @@ class LDAPValueList(list):
         except ValueError:
             lst2.append(value)
 
+    def __sync_keymap(self) -> Dict[bytes, Any]:
+        """
+        Return the key index of the list elements. The C part of the
+        module fills the list directly, bypassing the Python methods,
+        so the index is rebuilt whenever it's out of sync with the
+        list content.
+        """
+        keymap = self.__keymap
+        if len(keymap) != len(self):
+            keymap.clear()
+            for item in self:
+                keymap.setdefault(_lower_key(item), item)
+        return keymap
+
     def _append_unchecked(self, value: Any) -> None:
+        self.__sync_keymap()[_lower_key(value)] = value
         super().append(value)
 
     def _remove_unchecked(self, value: Any) -> None:
+        self.__sync_keymap()
         try:
             super().remove(value)
         except ValueError:
             pass
+        else:
+            self.__keymap.pop(_lower_key(value), None)
 
     @property
     def _status_dict(self) -> dict:
@@ -61,15 +101,18 @@ class LDAPValueList(list):
         }
 
     def __contains__(self, item: Any) -> bool:
-        return bonsai.utils._unique_contains(self, item)[0]
+        return _lower_key(item) in self.__sync_keymap()
 
     def __delitem__(self, idx: Union[SupportsIndex, slice]) -> None:
+        keymap = self.__sync_keymap()
         old_value = super().__getitem__(idx)
         if isinstance(idx, slice):
             for item in old_value:
                 self.__balance(self.__added, self.__deleted, item)
+                keymap.pop(_lower_key(item), None)
         else:
             self.__balance(self.__added, self.__deleted, old_value)
+            keymap.pop(_lower_key(old_value), None)
         super().__delitem__(idx)
 
     def __mul__(self, value: Any) -> "LDAPValueList":
@@ -89,20 +132,29 @@ class LDAPValueList(list):
         return self
 
     def __setitem__(self, idx: Union[SupportsIndex, slice], value: Any) -> None:
+        keymap = self.__sync_keymap()
         old_value = self[idx]
         if isinstance(idx, slice):
+            new_keys = {}  # type: Dict[bytes, Any]
             for item in value:
-                if item in self:
+                key = _lower_key(item)
+                if key in keymap or key in new_keys:
                     raise ValueError("%r is already in the list." % item)
+                new_keys[key] = item
             for item in old_value:
                 self.__balance(self.__added, self.__deleted, item)
+                keymap.pop(_lower_key(item), None)
             for item in value:
                 self.__balance(self.__deleted, self.__added, item)
+            keymap.update(new_keys)
         else:
-            if value in self:
+            key = _lower_key(value)
+            if key in keymap:
                 raise ValueError("%r is already in the list." % value)
             self.__balance(self.__added, self.__deleted, old_value)
             self.__balance(self.__deleted, self.__added, value)
+            keymap.pop(_lower_key(old_value), None)
+            keymap[key] = value
         super().__setitem__(idx, value)
 
     def append(self, item: Any) -> None:
@@ -113,10 +165,13 @@ class LDAPValueList(list):
         :raises ValueError: if the `item` is not unique.
         """
 
-        if item in self:
+        keymap = self.__sync_keymap()
+        key = _lower_key(item)
+        if key in keymap:
             raise ValueError("%r is already in the list." % item)
         self.__balance(self.__deleted, self.__added, item)
         self.__status = 1
+        keymap[key] = item
         super().append(item)
 
     def extend(self, items: Iterable[Any]) -> None:
@@ -128,12 +183,17 @@ class LDAPValueList(list):
         :param items: List of new items.
         :raises ValueError: if any of the items is already in the list.
         """
+        keymap = self.__sync_keymap()
+        new_keys = {}  # type: Dict[bytes, Any]
         for item in items:
-            if item in self:
+            key = _lower_key(item)
+            if key in keymap or key in new_keys:
                 raise ValueError("%r is already in the list." % item)
+            new_keys[key] = item
         for item in items:
             self.__balance(self.__deleted, self.__added, item)
         self.__status = 1
+        keymap.update(new_keys)
         super().extend(items)
 
     def insert(self, idx: SupportsIndex, value: Any) -> None:
@@ -144,10 +204,13 @@ class LDAPValueList(list):
         :param value: the new item.
         :raises ValueError: if the `item` is not unique.
         """
-        if value in self:
+        keymap = self.__sync_keymap()
+        key = _lower_key(value)
+        if key in keymap:
             raise ValueError("%r is already in the list." % value)
         self.__balance(self.__deleted, self.__added, value)
         self.__status = 1
+        keymap[key] = value
         super().insert(idx, value)
 
     def remove(self, value: Any) -> None:
@@ -157,10 +220,14 @@ class LDAPValueList(list):
         :param value: the item to be removed.
         :raises ValueError: if `value` is not int the list.
         """
-        contain, obj = bonsai.utils._unique_contains(self, value)
-        if not contain:
-            raise ValueError("%r is not in the list." % value)
+        keymap = self.__sync_keymap()
+        key = _lower_key(value)
+        try:
+            obj = keymap[key]
+        except KeyError:
+            raise ValueError("%r is not in the list." % value) from None
         super().remove(obj)
+        del keymap[key]
         self.__status = 1
         self.__balance(self.__added, self.__deleted, obj)
 
@@ -172,7 +239,9 @@ class LDAPValueList(list):
 
         :param int idx: optional index.
         """
+        self.__sync_keymap()
         value = super().pop(idx)
+        self.__keymap.pop(_lower_key(value), None)
         self.__balance(self.__added, self.__deleted, value)
         self.__status = 1
         return value